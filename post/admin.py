@@ -16,6 +16,7 @@ from .models import Post
 @admin.register(Post)
 class PostAdmin(MarkdownxModelAdmin):
     list_display = ['title', 'author', 'status', 'published_at']
+    list_select_related = ['author']
     list_filter = ['status', 'author', 'published_at']
     search_fields = ['title', 'body']
     prepopulated_fields = {'slug': ('title',)}
@@ -29,4 +30,12 @@ class PostAdmin(MarkdownxModelAdmin):
             'fields': ('created_at', 'updated_at', 'published_at'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+
+    def get_queryset(self, request):
+        # body is loaded lazily on the change form; search_vector is never shown
+        return (
+            super().get_queryset(request)
+            .select_related('author')
+            .defer('body', 'search_vector')
+        )
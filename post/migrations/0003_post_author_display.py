@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:47
+
+from django.db import migrations, models
+
+
+def backfill_author_display(apps, schema_editor):
+    Post = apps.get_model('post', 'Post')
+    posts = (
+        Post.objects.select_related('author')
+        .only('id', 'author__first_name', 'author__last_name', 'author__username')
+        .iterator(chunk_size=1000)
+    )
+    batch = []
+    for post in posts:
+        author = post.author
+        post.author_display = f"{author.first_name} {author.last_name}".strip() or author.username
+        batch.append(post)
+        if len(batch) == 1000:
+            Post.objects.bulk_update(batch, ['author_display'])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['author_display'])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0002_alter_post_body'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='author_display',
+            field=models.CharField(blank=True, editable=False, max_length=301),
+        ),
+        migrations.RunPython(backfill_author_display, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0003_post_author_display'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-published_at', '-id'], name='post_pub_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:49
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# Keeps search_vector in sync on every insert/update, including bulk_create
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE TRIGGER post_post_search_vector_update
+BEFORE INSERT OR UPDATE OF title, author_display, body ON post_post
+FOR EACH ROW EXECUTE FUNCTION
+tsvector_update_trigger(search_vector, 'pg_catalog.english', title, author_display, body);
+
+UPDATE post_post SET search_vector = to_tsvector(
+    'pg_catalog.english',
+    coalesce(title, '') || ' ' || coalesce(author_display, '') || ' ' || coalesce(body, '')
+);
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS post_post_search_vector_update ON post_post;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0004_post_pub_partial_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER_SQL, DROP_SEARCH_VECTOR_TRIGGER_SQL),
+    ]
@@ -1,5 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from markdownx.models import MarkdownxField
 
@@ -8,6 +12,12 @@ class PostStatus(models.TextChoices):
     PUBLISHED = 'published', 'Published'
     ARCHIVED = 'archived', 'Archived'
 
+AUTHOR_NAME_FIELDS = frozenset({'first_name', 'last_name', 'username'})
+
+def author_display_name(user):
+    # Full name when set, otherwise the username
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
 # Create your models here.
 class Post(models.Model):
     title = models.CharField(max_length=250)
@@ -15,6 +25,7 @@ class Post(models.Model):
     # body = models.TextField()
     body = MarkdownxField()  # stores raw Markdown; editor handles preview/uploads
     author = models.ForeignKey(User, on_delete=models.CASCADE)
+    author_display = models.CharField(max_length=301, blank=True, editable=False)  # denormalized for the detail endpoint
     status = models.CharField(
             max_length=20,
             choices=PostStatus.choices,
@@ -23,8 +34,47 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    # Maintained by a database trigger from title, author_display and body
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    class Meta:
+        indexes = [
+            # Matches PostListView: published-only, ordered by -published_at, -id
+            models.Index(
+                fields=['-published_at', '-id'],
+                condition=models.Q(status=PostStatus.PUBLISHED),
+                name='post_pub_partial_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+        ]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded author so save() only re-derives author_display on change
+        instance._loaded_author_id = instance.__dict__.get('author_id')
+        return instance
     
     def save(self, *args, **kwargs):
-        if self.status == PostStatus.PUBLISHED:
+        # Stamp the first publish only; later edits keep the original date
+        if self.status == PostStatus.PUBLISHED and self.published_at is None:
             self.published_at = timezone.now()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        if self.author_id != getattr(self, '_loaded_author_id', None):
+            self.author_display = author_display_name(self.author)
+        super().save(*args, **kwargs)
+        self._loaded_author_id = self.author_id
+
+
+@receiver(post_save, sender=User)
+def refresh_author_display(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Keep denormalized names (and the search vector trigger built from them) in step
+    # with User edits; bumping updated_at also retires cached detail responses
+    if raw:
+        return  # loaddata: fixtures carry their own author_display
+    if update_fields is not None and AUTHOR_NAME_FIELDS.isdisjoint(update_fields):
+        return  # e.g. update_last_login on every login
+    name = author_display_name(instance)
+    Post.objects.filter(author=instance).exclude(author_display=name).update(
+        author_display=name,
+        updated_at=timezone.now(),
+    )
@@ -0,0 +1,7 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class PostPagination(PageNumberPagination):
+    # Clients needing only a few posts can ask for a smaller page (?page_size=5)
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -1,12 +1,40 @@
+from urllib.parse import quote
+
 from rest_framework import serializers
-from django.urls import reverse
+from django.core.cache import cache
+from django.utils.http import RFC3986_SUBDELIMS
 import nh3
 from markdownx.utils import markdownify
 
 from .models import Post
 
+BODY_CACHE_TIMEOUT = 60 * 60
+
+class SlugURLTemplateField(serializers.HyperlinkedIdentityField):
+    """
+    Reverses the detail route once per serializer and substitutes each slug,
+    instead of walking the URL resolver for every row.
+    """
+    placeholder = '__slug__'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._url_template = None
+
+    def get_url(self, obj, view_name, request, format):
+        if format:
+            return super().get_url(obj, view_name, request, format)
+        if self._url_template is None:
+            self._url_template = self.reverse(
+                view_name, kwargs={self.lookup_url_kwarg: self.placeholder}, request=request
+            )
+        # Same safe set reverse() uses, so sub-delimiters like ' ( ) , ! stay unescaped
+        slug = quote(getattr(obj, self.lookup_field), safe=RFC3986_SUBDELIMS + "/~:@")
+        return self._url_template.replace(self.placeholder, slug)
+
+
 class PostListSerializer(serializers.ModelSerializer):
-    url = serializers.HyperlinkedIdentityField(
+    url = SlugURLTemplateField(
         view_name='post:post-detail',
         lookup_field='slug'
     )
@@ -21,20 +49,22 @@ class PostDetailSerializer(serializers.ModelSerializer):
     author = serializers.SerializerMethodField()
     
     def get_body(self, obj):
-        try:
-            html = markdownify(obj.body)
-            clean_html = nh3.clean(
-                html,
-                tags={'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'br', 'strong', 'em', 'ul', 'ol', 'li', 'a', 'blockquote', 'code', 'pre'},
-                attributes={'a': {'href', 'title'}},
-            )
-            return clean_html
-        except Exception:
-            return obj.body  # Fallback to raw markdown if processing fails
+        # Rendered HTML only changes when the post does, so key it on updated_at
+        key = f"post:body:{obj.pk}:{obj.updated_at.timestamp()}"
+        return cache.get_or_set(key, lambda: self.render_body(obj.body), BODY_CACHE_TIMEOUT)
+    
+    @staticmethod
+    def render_body(markdown_text):
+        html = markdownify(markdown_text)
+        return nh3.clean(
+            html,
+            tags={'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'br', 'strong', 'em', 'ul', 'ol', 'li', 'a', 'blockquote', 'code', 'pre'},
+            attributes={'a': {'href', 'title'}},
+        )
     
     def get_author(self, obj):
-        # return author name instead of ID
-        return f"{obj.author.first_name} {obj.author.last_name}".strip() or obj.author.username
+        # return author name instead of ID, denormalized on save
+        return obj.author_display
     
     class Meta:
         model = Post
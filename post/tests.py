@@ -1,3 +1,100 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from .models import Post, PostStatus
+from .serializers import PostListSerializer
+
+
+class PostTestMixin:
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username='jane_writer', first_name='Jane', last_name='Smith'
+        )
+
+    def make_post(self, slug='hello-world', status=PostStatus.PUBLISHED):
+        return Post.objects.create(
+            title='Hello world',
+            slug=slug,
+            body='# Hello',
+            author=self.author,
+            status=status,
+        )
+
+
+class PostModelTests(PostTestMixin, TestCase):
+    def test_resave_keeps_published_at(self):
+        post = self.make_post()
+        published_at = post.published_at
+        self.assertIsNotNone(published_at)
+
+        post.title = 'Hello again'
+        post.save()
+        post.refresh_from_db()
+        self.assertEqual(post.published_at, published_at)
+
+    def test_author_display_follows_user_rename(self):
+        post = self.make_post()
+        self.assertEqual(post.author_display, 'Jane Smith')
+
+        self.author.last_name = 'Doe'
+        self.author.save()
+        post.refresh_from_db()
+        self.assertEqual(post.author_display, 'Jane Doe')
+
+    def test_last_login_update_skips_post_refresh(self):
+        self.make_post()
+        # Only the auth_user UPDATE; no post_post query from the receiver
+        with self.assertNumQueries(1):
+            self.author.save(update_fields=['last_login'])
+
+
+class SlugURLTemplateFieldTests(TestCase):
+    def test_urls_match_reverse(self):
+        request = APIRequestFactory().get('/api/v1/posts/')
+        slugs = ["a'b(c)", 'x,y!z', 'café', 'slug with spaces', 'plain-slug']
+        posts = [Post(title=slug, slug=slug) for slug in slugs]
+
+        data = PostListSerializer(posts, many=True, context={'request': request}).data
+
+        for slug, item in zip(slugs, data):
+            expected = reverse('post:post-detail', kwargs={'slug': slug}, request=request)
+            self.assertEqual(item['url'], expected)
+
+
+class PostDetailViewTests(PostTestMixin, TestCase):
+    def test_if_modified_since_returns_304(self):
+        post = self.make_post()
+        url = reverse('post:post-detail', kwargs={'slug': post.slug})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('max-age=60', response['Cache-Control'])
+
+    def test_draft_returns_404(self):
+        post = self.make_post(status=PostStatus.DRAFT)
+        response = self.client.get(reverse('post:post-detail', kwargs={'slug': post.slug}))
+        self.assertEqual(response.status_code, 404)
+
+
+class PostListViewTests(PostTestMixin, TestCase):
+    def test_page_size_is_capped(self):
+        Post.objects.bulk_create(
+            Post(
+                title=f'Post {i}',
+                slug=f'post-{i}',
+                body='Body',
+                author=self.author,
+                author_display='Jane Smith',
+                status=PostStatus.PUBLISHED,
+            )
+            for i in range(105)
+        )
+
+        response = self.client.get(reverse('post:post-list'), {'page_size': 500})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 100)
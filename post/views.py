@@ -1,10 +1,42 @@
+from functools import wraps
+
 from rest_framework import generics
 from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.response import Response
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, IsoDateTimeFilter
 
 from .models import Post, PostStatus
+from .pagination import PostPagination
 from .serializers import PostListSerializer, PostDetailSerializer
 
+DETAIL_CACHE_TIMEOUT = 60 * 60
+
+
+def post_last_modified(request, slug):
+    # Drives conditional GETs (If-Modified-Since -> 304) for the detail view
+    return (
+        Post.objects.filter(slug=slug, status=PostStatus.PUBLISHED)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+
+
+def detail_cache_control(view_func):
+    # Applied outside condition() so 304s carry the same freshness lifetime as
+    # 200s; 404s stay uncached in case the post is published later
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(response, public=True, max_age=60, s_maxage=3600)
+        return response
+    return wrapper
+
 
 class PostFilter(FilterSet):
     published_after = IsoDateTimeFilter(
@@ -23,48 +55,90 @@ class PostFilter(FilterSet):
         fields = []
 
 
+class PostSearchFilter(SearchFilter):
+    """
+    Full-text search on the view's search vector field instead of ILIKE scans.
+
+    `search_fields` names a SearchVectorField; the query is parsed with
+    websearch syntax (quoted phrases, `or`, `-term`).
+    """
+
+    search_description = "Full-text search over title, body and author name."
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        terms = request.query_params.get(self.search_param, "").strip()
+        if not search_fields or not terms:
+            return queryset
+
+        query = SearchQuery(terms, config="english", search_type="websearch")
+        return queryset.filter(**{search_fields[0]: query})
+
+
 class PostListView(generics.ListAPIView):
     """
     List posts.
 
     Query params:
-      - search: Case-insensitive match on title, body, author first/last name.
+      - search: Full-text match on title, body and author name.
       - published_after: ISO 8601 datetime; includes items with published_at >= value.
       - published_before: ISO 8601 datetime; includes items with published_at <= value.
       - ordering: published_at, -published_at, created_at, -created_at (default: -published_at).
+      - page_size: Results per page, up to 100 (default: PAGE_SIZE).
 
     Notes:
       - Results are paginated per DRF settings (e.g., PAGE_SIZE).
     """
 
     serializer_class = PostListSerializer
-    filter_backends = [SearchFilter, DjangoFilterBackend, OrderingFilter]
-    search_fields = ["title", "body", "author__first_name", "author__last_name"]
+    pagination_class = PostPagination
+    filter_backends = [PostSearchFilter, DjangoFilterBackend, OrderingFilter]
+    search_fields = ["search_vector"]
     filterset_class = PostFilter
     ordering_fields = ["published_at", "created_at"]
     ordering = ["-published_at", "-id"]
+    # Query params consumed by filter_backends; without any, filtering is a no-op
+    filter_params = ("search", "ordering", "published_after", "published_before")
+
+    def filter_queryset(self, queryset):
+        # Default listing: skip building the FilterSet and search/ordering backends
+        if not any(param in self.request.query_params for param in self.filter_params):
+            return queryset.order_by(*self.ordering)
+        return super().filter_queryset(queryset)
 
     def get_queryset(self):
-        # Published-only list; optimized for author data in the list serializer
+        # Published-only list; the list serializer never reads body or author
         return (
             Post.objects.filter(status=PostStatus.PUBLISHED)
-            .select_related("author")
+            .only("id", "title", "slug", "published_at")
         )
 
+@method_decorator(
+    [detail_cache_control, condition(last_modified_func=post_last_modified)], name="get"
+)
 class PostDetailView(generics.RetrieveAPIView):
     """
     Retrieve a single post by slug.
     
     Returns 404 for non-existent or unpublished posts.
     Converts markdown body to sanitized HTML.
+    Sends Last-Modified and answers If-Modified-Since with 304; responses
+    are cacheable by clients (60s) and shared caches (1h).
     """
     
     serializer_class = PostDetailSerializer
     lookup_field = 'slug'
     
     def get_queryset(self):
-        # Only published posts, with author data
-        return (
-            Post.objects.filter(status=PostStatus.PUBLISHED)
-            .select_related("author")
-        )
\ No newline at end of file
+        # Only published posts; author name is read from author_display, and the
+        # body-sized search_vector is never serialized
+        return Post.objects.filter(status=PostStatus.PUBLISHED).defer('search_vector')
+    
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        # Serialized payload is stable until the post is edited
+        key = f"post:json:{instance.pk}:{instance.updated_at.timestamp()}"
+        data = cache.get_or_set(
+            key, lambda: self.get_serializer(instance).data, DETAIL_CACHE_TIMEOUT
+        )
+        return Response(data)
@@ -30,66 +30,299 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import requests_cache  # Optional: HTTP caching that honors the API's cache headers
+except ImportError:
+    requests_cache = None
+try:
+    import orjson  # Optional: faster JSON decoding of API responses
+except ImportError:
+    orjson = None
+import hashlib
 import json
+import logging
 import sys
 import re
-from datetime import datetime, timedelta
-from urllib.parse import urlencode
+import statistics
+import threading
+import time
+from time import perf_counter
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import argparse
+from pathlib import Path
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+CACHE_DIR = Path(__file__).resolve().parent / '.test_api_cache'
+MAX_CONCURRENT_REQUESTS = 10  # Cap on parallel probes so the dev server isn't flooded
+FRESH_HEADERS = {'Cache-Control': 'no-store'}  # Skips the on-disk HTTP cache for timed requests
+REQUEST_TIMEOUT = (2, 5)  # (connect, read) seconds; retries cover transient failures
+MAX_CONCURRENT_TESTS = 8  # Test methods run side by side; each is mostly waiting on HTTP
+# Timing tests run one at a time after the parallel batch so other traffic doesn't skew them
+ISOLATED_TESTS = frozenset({
+    'test_response_performance',
+    'test_load_throughput',
+    'test_detail_endpoint_performance',
+})
+
+# Compiled once; used against every detail body
+HTML_TAGS_PATTERN = re.compile(r'<[^>]+>')
+DANGEROUS_PATTERN_SOURCES = (
+    r'<script[^>]*>',
+    r'<iframe[^>]*>',
+    r'<object[^>]*>',
+    r'<embed[^>]*>',
+    r'<form[^>]*>',
+    r'<input[^>]*>',
+    r'javascript:',
+    r'on\w+\s*=',  # event handlers like onclick, onmouseover
+)
+# Single alternation so each body is scanned once; group p<i> maps back to source i
+DANGEROUS_PATTERN = re.compile(
+    '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(DANGEROUS_PATTERN_SOURCES)),
+    re.IGNORECASE,
+)
+get_title = itemgetter('title')
+
+# Fixed request inputs shared by every run
+SEARCH_TERMS = ('Django', 'Python', 'API', 'development', 'guide')
+SPECIAL_CHAR_SEARCHES = ('<script>', '&amp;', '"quotes"', "SQL'; DROP TABLE--")
+FILTER_DATE_AFTER_STR = '2025-01-01T00:00:00Z'
+FILTER_DATE_AFTER = datetime(2025, 1, 1, tzinfo=timezone.utc)
+FILTER_DATE_BEFORE_STR = '2025-12-31T23:59:59Z'
+COMBINED_DATE_AFTER_STR = '2025-09-01T00:00:00Z'
+COMBINED_DATE_AFTER = datetime(2025, 9, 1, tzinfo=timezone.utc)
+
+
+def slug_from_url(url):
+    """Extract the slug from a post detail URL, or None if it isn't one"""
+    _, sep, slug = url.rpartition('/posts/')
+    return slug.rstrip('/') if sep else None
+
+
+def raw_url_cache_key(request, **kwargs):
+    """HTTP cache key on the exact URL; the default key normalizes '/posts//' into '/posts/'"""
+    return hashlib.sha1(f"{request.method} {request.url}".encode()).hexdigest()
+
+
+def mount_pooled_adapter(session, pool_maxsize=32, connect_retries=0):
+    """Mount a keep-alive connection pool with retries for transient 5xx and read errors on a session"""
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            connect=connect_retries,  # By default a refused connection means the server is down; fail fast
+            backoff_factor=0.3,
+            # 429 is left out: the throttle's Retry-After can be an hour, and a
+            # throttled run should fail rather than sleep through it
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 
 class APITester:
-    def __init__(self, base_url="http://localhost:8000", verbose=False):
+    def __init__(self, base_url="http://localhost:8000", verbose=False, use_cache=True, cache_ttl=300,
+                 load_requests=0, load_concurrency=32):
         self.base_url = base_url.rstrip('/')
         self.api_endpoint = f"{self.base_url}/api/v1/posts/"
         self.verbose = verbose
+        self.logger = logging.getLogger('apitest')
+        self.logger.setLevel(logging.INFO if verbose else logging.WARNING)
+        self.use_cache = use_cache  # Reuse list responses saved on disk by earlier runs
+        self.cache_ttl = cache_ttl
+        self.load_requests = load_requests  # 0 skips the load benchmark
+        self.load_concurrency = load_concurrency
         self.passed = 0
         self.failed = 0
+        self.cached_responses = 0  # Served from .test_api_cache without reaching the server
+        self._counter_lock = threading.Lock()  # Tests run on worker threads
         self._published_posts = None  # Cache for published post data
-        
-    def log(self, message, level="INFO"):
-        if self.verbose or level == "ERROR":
-            print(f"[{level}] {message}")
+        self._responses = {}  # (URL, params) -> Future of (data, success, status_code) for this run
+        self._responses_lock = threading.Lock()
+        
+        # Pooled keep-alive session shared by every request
+        if use_cache and requests_cache is not None:
+            # Successful GETs are kept on disk for cache_ttl seconds so re-runs skip the
+            # round trip; server Cache-Control (post details) takes precedence, and stale
+            # entries are revalidated with If-Modified-Since as bodiless 304s
+            self.session = requests_cache.CachedSession(
+                str(CACHE_DIR / 'http_cache'),
+                backend='sqlite',
+                cache_control=True,
+                expire_after=cache_ttl,
+                allowable_methods=('GET',),
+                key_fn=raw_url_cache_key,
+            )
+        else:
+            self.session = requests.Session()
+        mount_pooled_adapter(self.session)
+        # Long-lived workers for fanning out independent requests
+        self.pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        
+    def close(self):
+        """Release pooled connections and request workers"""
+        self.pool.shutdown()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def test_assert(self, condition, test_name, error_msg=""):
         if condition:
-            self.passed += 1
-            self.log(f"✓ PASS: {test_name}")
+            with self._counter_lock:
+                self.passed += 1
+            self.logger.info("✓ PASS: %s", test_name)
             return True
         else:
-            self.failed += 1
-            self.log(f"✗ FAIL: {test_name} - {error_msg}", "ERROR")
+            with self._counter_lock:
+                self.failed += 1
+            self.logger.error("✗ FAIL: %s - %s", test_name, error_msg)
             return False
     
-    def make_request(self, params=None, endpoint=None):
-        """Make a GET request to the API endpoint"""
+    def make_request(self, params=None, endpoint=None, fresh=False):
+        """Make a GET request to the API endpoint, reusing identical earlier responses unless fresh"""
+        url = endpoint or self.api_endpoint
+        if fresh:
+            return self._get(url, params, fresh=True)
+        
+        key = (url, tuple(sorted(params.items())) if params else ())
+        # Tests run in parallel, so callers share the in-flight request as well as finished ones
+        with self._responses_lock:
+            future = self._responses.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._responses[key] = Future()
+        
+        if not is_owner:
+            self.logger.info("Reused response: GET %s %s", url, params or '')
+            return future.result()
+        
         try:
-            url = endpoint or self.api_endpoint
-            if params:
-                url += f"?{urlencode(params)}"
-            
-            self.log(f"Request: GET {url}")
-            response = requests.get(url, timeout=10)
+            result = self._get(url, params)
+        except BaseException as e:
+            self._forget_response(key)
+            future.set_exception(e)
+            raise
+        if result[2] is None:  # Don't pin connection errors for the rest of the run
+            self._forget_response(key)
+        future.set_result(result)
+        return result
+    
+    def _forget_response(self, key):
+        with self._responses_lock:
+            del self._responses[key]
+    
+    def _get(self, url, params=None, fresh=False):
+        """Send a GET request and decode the JSON body; fresh bypasses the on-disk HTTP cache"""
+        try:
+            response = self.session.get(
+                url,
+                params=params,
+                headers=FRESH_HEADERS if fresh else None,
+                timeout=REQUEST_TIMEOUT,
+            )
+            self.logger.info("Request: GET %s", response.request.url)
+            if getattr(response, 'from_cache', False) and not getattr(response, 'revalidated', False):
+                self._count_cached_response()
             
             if response.status_code == 200:
-                return response.json(), True, response.status_code
+                return json_loads(response.content), True, response.status_code
             else:
-                self.log(f"HTTP {response.status_code}: {response.text}", "ERROR")
+                # Error pages can be large; only decode the head of the body
+                body = response.content[:512].decode('utf-8', 'replace')
+                self.logger.error("HTTP %s: %s", response.status_code, body)
                 return None, False, response.status_code
                 
-        except requests.exceptions.RequestException as e:
-            self.log(f"Request failed: {e}", "ERROR")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.error("Request failed: %s", e)
             return None, False, None
     
-    def make_detail_request(self, slug):
+    def _count_cached_response(self):
+        with self._counter_lock:
+            self.cached_responses += 1
+    
+    def endpoint_check(self):
+        """Check the list endpoint is up with a bodiless HEAD request"""
+        try:
+            # Plain session without the retry policy: one attempt answers "is it up"
+            with requests.Session() as session:
+                response = session.head(self.api_endpoint, timeout=2)
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Request failed: %s", e)
+            return False
+        return response.status_code == 200  # 404 means a wrong base URL or missing route
+    
+    def make_detail_request(self, slug, fresh=False):
         """Make a GET request to the detail endpoint"""
         detail_url = f"{self.base_url}/api/v1/posts/{slug}/"
-        return self.make_request(endpoint=detail_url)
+        return self.make_request(endpoint=detail_url, fresh=fresh)
+    
+    def make_requests(self, params_list):
+        """Make independent list requests concurrently; results keep input order"""
+        return list(self.pool.map(self.make_request, params_list))
+    
+    def first_search_hit(self, terms):
+        """Search all terms concurrently; return (term, data) for the first term, in order, with results"""
+        futures = [self.pool.submit(self.make_request, {'search': term}) for term in terms]
+        try:
+            for term, future in zip(terms, futures):
+                data, success, _ = future.result()
+                if success and data['results']:
+                    return term, data
+        finally:
+            for future in futures:
+                future.cancel()  # Drop probes that haven't started yet
+        return None, None
+    
+    def make_detail_requests(self, slugs):
+        """Make independent detail requests concurrently; results keep input order"""
+        return list(self.pool.map(self.make_detail_request, slugs))
+    
+    def make_cached_request(self, params=None):
+        """Make a list request, reusing an on-disk response younger than cache_ttl"""
+        if not self.use_cache:
+            return self.make_request(params)
+        
+        key = json.dumps([self.api_endpoint, sorted((params or {}).items())])
+        cache_file = CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                self.logger.info("Cache hit: %s", cache_file.name)
+                self._count_cached_response()
+                return json_loads(cache_file.read_bytes()), True, 200
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry; fall through to the API
+        
+        data, success, status_code = self.make_request(params)
+        if success:
+            CACHE_DIR.mkdir(exist_ok=True)
+            cache_file.write_text(json.dumps(data))
+        return data, success, status_code
+    
+    def fetch_details_batch(self, posts):
+        """Prefetch details for list posts concurrently so later lookups reuse them"""
+        slugs = [slug_from_url(post.get('url', '')) for post in posts]
+        self.make_detail_requests([slug for slug in slugs if slug is not None])
     
     def get_published_posts(self):
         """Get a list of published posts for testing detail endpoint"""
         if self._published_posts is None:
-            data, success, _ = self.make_request()
+            # Detail tests look at no more than 5 posts
+            data, success, _ = self.make_cached_request({'page_size': 5})
             if success and data.get('results'):
                 self._published_posts = data['results']
             else:
@@ -117,7 +350,7 @@ class APITester:
     
     def test_basic_list_endpoint(self):
         """Test 1: Basic list endpoint returns only published posts"""
-        self.log("\n=== Testing Basic List Endpoint ===")
+        self.logger.info("\n=== Testing Basic List Endpoint ===")
         
         data, success, _ = self.make_request()
         if not success:
@@ -133,7 +366,7 @@ class APITester:
     
     def test_pagination(self):
         """Test 2: Pagination works correctly"""
-        self.log("\n=== Testing Pagination ===")
+        self.logger.info("\n=== Testing Pagination ===")
         
         # Get first page
         data, success, _ = self.make_request()
@@ -163,45 +396,40 @@ class APITester:
                 )
                 
                 # Ensure no duplicate items between pages
-                page1_titles = {item['title'] for item in data['results']}
-                page2_titles = {item['title'] for item in data2['results']}
-                overlap = page1_titles.intersection(page2_titles)
+                page1_titles = set(map(get_title, data['results']))
+                no_overlap = page1_titles.isdisjoint(map(get_title, data2['results']))
                 
                 self.test_assert(
-                    len(overlap) == 0,
+                    no_overlap,
                     "Pagination - no duplicate items between pages",
-                    f"Found {len(overlap)} duplicates"
+                    # Only build the overlap when reporting a failure
+                    "" if no_overlap else
+                    f"Found {len(page1_titles.intersection(map(get_title, data2['results'])))} duplicates"
                 )
         
         return True
     
     def test_search_functionality(self):
         """Test 3: Search functionality"""
-        self.log("\n=== Testing Search Functionality ===")
+        self.logger.info("\n=== Testing Search Functionality ===")
         
         # Test basic search
-        search_terms = ['Django', 'Python', 'API', 'development', 'guide']
-        
-        for term in search_terms:
-            data, success, _ = self.make_request({'search': term})
-            if success and len(data['results']) > 0:
-                self.log(f"Search for '{term}' returned {len(data['results'])} results")
-                self.validate_response_structure(data, f"Search for '{term}'")
-                
-                # Verify search results contain the term (case-insensitive)
-                found_match = False
-                for result in data['results'][:3]:  # Check first 3 results
-                    title_match = term.lower() in result['title'].lower()
-                    if title_match:
-                        found_match = True
-                        break
-                
-                self.test_assert(
-                    found_match,
-                    f"Search for '{term}' - results contain search term",
-                    f"Term '{term}' not found in first 3 result titles"
-                )
-                break
+        term, data = self.first_search_hit(SEARCH_TERMS)
+        if term is not None:
+            self.logger.info("Search for '%s' returned %d results", term, len(data['results']))
+            self.validate_response_structure(data, f"Search for '{term}'")
+            
+            # Verify search results contain the term (case-insensitive)
+            term_lower = term.lower()
+            found_match = any(  # Check first 3 results
+                term_lower in title.lower() for title in map(get_title, data['results'][:3])
+            )
+            
+            self.test_assert(
+                found_match,
+                f"Search for '{term}' - results contain search term",
+                f"Term '{term}' not found in first 3 result titles"
+            )
         
         # Test empty search
         data, success, _ = self.make_request({'search': 'xyzabcnonexistentterm123'})
@@ -216,61 +444,61 @@ class APITester:
     
     def test_date_filtering(self):
         """Test 4: Date filtering functionality"""
-        self.log("\n=== Testing Date Filtering ===")
+        self.logger.info("\n=== Testing Date Filtering ===")
         
         # Test published_after filter
-        test_date = "2025-01-01T00:00:00Z"
+        test_date = FILTER_DATE_AFTER_STR
         data, success, _ = self.make_request({'published_after': test_date})
         if success:
             self.validate_response_structure(data, "Date filtering - published_after")
-            self.log(f"published_after {test_date} returned {data['count']} results")
+            self.logger.info("published_after %s returned %s results", test_date, data['count'])
             
             # Verify dates are after the filter date
             if len(data['results']) > 0:
                 for result in data['results'][:3]:  # Check first 3
                     published_at = result.get('published_at')
                     if published_at:
-                        result_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        filter_date = datetime.fromisoformat(test_date.replace('Z', '+00:00'))
+                        # Python 3.11+ fromisoformat parses the trailing 'Z' directly
+                        result_date = datetime.fromisoformat(published_at)
                         
                         self.test_assert(
-                            result_date >= filter_date,
+                            result_date >= FILTER_DATE_AFTER,
                             f"Date filtering - result date {published_at} >= filter date",
                             f"Result date {published_at} is before filter date {test_date}"
                         )
         
         # Test published_before filter
-        test_date_before = "2025-12-31T23:59:59Z"
+        test_date_before = FILTER_DATE_BEFORE_STR
         data, success, _ = self.make_request({'published_before': test_date_before})
         if success:
             self.validate_response_structure(data, "Date filtering - published_before")
-            self.log(f"published_before {test_date_before} returned {data['count']} results")
+            self.logger.info("published_before %s returned %s results", test_date_before, data['count'])
         
         # Test date range
         data, success, _ = self.make_request({
-            'published_after': '2025-01-01T00:00:00Z',
-            'published_before': '2025-12-31T23:59:59Z'
+            'published_after': FILTER_DATE_AFTER_STR,
+            'published_before': FILTER_DATE_BEFORE_STR
         })
         if success:
             self.validate_response_structure(data, "Date filtering - date range")
-            self.log(f"Date range filtering returned {data['count']} results")
+            self.logger.info("Date range filtering returned %s results", data['count'])
         
         return True
     
     def test_combined_queries(self):
         """Test 5: Combined search and date filtering"""
-        self.log("\n=== Testing Combined Queries ===")
+        self.logger.info("\n=== Testing Combined Queries ===")
         
         # Combine search with date filter
         params = {
             'search': 'Django',
-            'published_after': '2025-09-01T00:00:00Z'
+            'published_after': COMBINED_DATE_AFTER_STR
         }
         
         data, success, _ = self.make_request(params)
         if success:
             self.validate_response_structure(data, "Combined query - search + date")
-            self.log(f"Combined query returned {data['count']} results")
+            self.logger.info("Combined query returned %s results", data['count'])
             
             # Verify both filters are applied
             if len(data['results']) > 0:
@@ -278,11 +506,8 @@ class APITester:
                 title_contains_search = 'django' in result['title'].lower()
                 
                 if result.get('published_at'):
-                    published_date = datetime.fromisoformat(
-                        result['published_at'].replace('Z', '+00:00')
-                    )
-                    filter_date = datetime.fromisoformat('2025-09-01T00:00:00+00:00')
-                    date_after_filter = published_date >= filter_date
+                    published_date = datetime.fromisoformat(result['published_at'])
+                    date_after_filter = published_date >= COMBINED_DATE_AFTER
                     
                     self.test_assert(
                         date_after_filter,
@@ -294,7 +519,7 @@ class APITester:
     
     def test_edge_cases(self):
         """Test 6: Edge cases and boundary conditions"""
-        self.log("\n=== Testing Edge Cases ===")
+        self.logger.info("\n=== Testing Edge Cases ===")
         
         # Test invalid date format
         data, success, _ = self.make_request({'published_after': 'invalid-date'})
@@ -329,9 +554,8 @@ class APITester:
         )
         
         # Test special characters in search
-        special_chars = ['<script>', '&amp;', '"quotes"', "SQL'; DROP TABLE--"]
-        for chars in special_chars:
-            data, success, _ = self.make_request({'search': chars})
+        responses = self.make_requests([{'search': chars} for chars in SPECIAL_CHAR_SEARCHES])
+        for chars, (data, success, _) in zip(SPECIAL_CHAR_SEARCHES, responses):
             self.test_assert(
                 success is not None,
                 f"Edge case - special characters '{chars[:20]}...' handled safely"
@@ -341,13 +565,11 @@ class APITester:
     
     def test_response_performance(self):
         """Test 7: Response performance"""
-        self.log("\n=== Testing Response Performance ===")
-        
-        import time
+        self.logger.info("\n=== Testing Response Performance ===")
         
-        start_time = time.time()
-        data, success, _ = self.make_request()
-        end_time = time.time()
+        start_time = perf_counter()
+        data, success, _ = self.make_request(fresh=True)
+        end_time = perf_counter()
         
         response_time = end_time - start_time
         
@@ -357,13 +579,66 @@ class APITester:
             f"Response took {response_time:.2f} seconds"
         )
         
-        self.log(f"API response time: {response_time:.3f} seconds")
+        self.logger.info("API response time: %.3f seconds", response_time)
+        
+        return True
+    
+    def test_load_throughput(self):
+        """Test 7b: Throughput and latency percentiles under concurrent load"""
+        if self.load_requests < 2:
+            return True
+        
+        self.logger.info("\n=== Testing Load Throughput ===")
+        
+        # Dedicated uncached session with one pooled connection per worker, so the
+        # benchmark times requests rather than reconnects
+        # A burst of new connections can overflow runserver's small accept backlog, so
+        # connecting is retried here; the retry time still counts toward latency
+        session = mount_pooled_adapter(
+            requests.Session(), pool_maxsize=self.load_concurrency, connect_retries=3
+        )
+        
+        def timed_request(_):
+            start_time = perf_counter()
+            try:
+                status_code = session.get(self.api_endpoint, timeout=REQUEST_TIMEOUT).status_code
+            except requests.exceptions.RequestException:
+                status_code = None
+            return perf_counter() - start_time, status_code
+        
+        with session:
+            start_time = perf_counter()
+            with ThreadPoolExecutor(max_workers=self.load_concurrency) as pool:
+                samples = list(pool.map(timed_request, range(self.load_requests)))
+            wall_time = perf_counter() - start_time
+        
+        latencies = [latency for latency, _ in samples]
+        errors = sum(1 for _, status_code in samples if status_code != 200)
+        cut_points = statistics.quantiles(latencies, n=100)
+        p50, p95, p99 = cut_points[49], cut_points[94], cut_points[98]
+        
+        self.test_assert(
+            errors == 0,
+            "Load - all requests succeeded",
+            f"{errors} of {self.load_requests} requests failed"
+        )
+        self.test_assert(
+            p99 < 5.0,
+            "Load - p99 response time under 5 seconds",
+            f"p99 was {p99:.2f} seconds"
+        )
+        
+        self.logger.info(
+            "Load: %d requests at concurrency %d, %.1f req/s, p50 %.0fms, p95 %.0fms, p99 %.0fms",
+            self.load_requests, self.load_concurrency, self.load_requests / wall_time,
+            p50 * 1000, p95 * 1000, p99 * 1000,
+        )
         
         return True
     
     def test_detail_endpoint_success(self):
         """Test 8: Detail endpoint success cases with valid published posts"""
-        self.log("\n=== Testing Detail Endpoint Success Cases ===")
+        self.logger.info("\n=== Testing Detail Endpoint Success Cases ===")
         
         published_posts = self.get_published_posts()
         if not published_posts:
@@ -372,12 +647,12 @@ class APITester:
         
         # Test first few published posts
         test_count = min(3, len(published_posts))
+        self.fetch_details_batch(published_posts[:test_count])
         for i in range(test_count):
             post = published_posts[i]
             # Extract slug from the URL field
-            url = post.get('url', '')
-            if '/posts/' in url:
-                slug = url.split('/posts/')[-1].rstrip('/')
+            slug = slug_from_url(post.get('url', ''))
+            if slug is not None:
                 
                 data, success, status_code = self.make_detail_request(slug)
                 
@@ -420,7 +695,7 @@ class APITester:
     
     def test_detail_endpoint_404_cases(self):
         """Test 9: 404 handling for non-existent slugs and draft posts"""
-        self.log("\n=== Testing Detail Endpoint 404 Cases ===")
+        self.logger.info("\n=== Testing Detail Endpoint 404 Cases ===")
         
         # Test non-existent slug
         fake_slug = "non-existent-post-slug-12345"
@@ -443,8 +718,9 @@ class APITester:
             "slug@with@symbols",
         ]
         
-        for bad_slug in malformed_slugs[:3]:  # Test first 3 to save time
-            data, success, status_code = self.make_detail_request(bad_slug)
+        bad_slugs = malformed_slugs[:3]  # Test first 3 to save time
+        responses = self.make_detail_requests(bad_slugs)
+        for bad_slug, (data, success, status_code) in zip(bad_slugs, responses):
             self.test_assert(
                 status_code in [404, 400],
                 f"Detail endpoint - malformed slug '{bad_slug[:20]}...' handled appropriately",
@@ -455,7 +731,7 @@ class APITester:
     
     def test_markdown_conversion(self):
         """Test 10: Markdown-to-HTML conversion validation"""
-        self.log("\n=== Testing Markdown Conversion ===")
+        self.logger.info("\n=== Testing Markdown Conversion ===")
         
         published_posts = self.get_published_posts()
         if not published_posts:
@@ -463,13 +739,13 @@ class APITester:
         
         # Test a few posts to check markdown conversion
         test_count = min(3, len(published_posts))
+        self.fetch_details_batch(published_posts[:test_count])
         html_found = False
         
         for i in range(test_count):
             post = published_posts[i]
-            url = post.get('url', '')
-            if '/posts/' in url:
-                slug = url.split('/posts/')[-1].rstrip('/')
+            slug = slug_from_url(post.get('url', ''))
+            if slug is not None:
                 
                 data, success, status_code = self.make_detail_request(slug)
                 
@@ -477,8 +753,7 @@ class APITester:
                     body = data['body']
                     
                     # Check if body contains HTML tags (indicating markdown conversion)
-                    html_tags_pattern = r'<[^>]+>'
-                    has_html_tags = bool(re.search(html_tags_pattern, body))
+                    has_html_tags = bool(HTML_TAGS_PATTERN.search(body))
                     
                     if has_html_tags:
                         html_found = True
@@ -500,13 +775,13 @@ class APITester:
                         break
         
         if not html_found:
-            self.log("Warning: No HTML tags found in tested posts. Markdown conversion may not be working.", "ERROR")
+            self.logger.error("Warning: No HTML tags found in tested posts. Markdown conversion may not be working.")
         
         return True
     
     def test_html_sanitization(self):
         """Test 11: HTML sanitization verification"""
-        self.log("\n=== Testing HTML Sanitization ===")
+        self.logger.info("\n=== Testing HTML Sanitization ===")
         
         published_posts = self.get_published_posts()
         if not published_posts:
@@ -514,12 +789,12 @@ class APITester:
         
         # Test posts to ensure dangerous tags are stripped
         test_count = min(5, len(published_posts))
+        self.fetch_details_batch(published_posts[:test_count])
         
         for i in range(test_count):
             post = published_posts[i]
-            url = post.get('url', '')
-            if '/posts/' in url:
-                slug = url.split('/posts/')[-1].rstrip('/')
+            slug = slug_from_url(post.get('url', ''))
+            if slug is not None:
                 
                 data, success, status_code = self.make_detail_request(slug)
                 
@@ -527,19 +802,9 @@ class APITester:
                     body = data['body']
                     
                     # Check for dangerous tags that should be stripped
-                    dangerous_patterns = [
-                        r'<script[^>]*>',
-                        r'<iframe[^>]*>',
-                        r'<object[^>]*>',
-                        r'<embed[^>]*>',
-                        r'<form[^>]*>',
-                        r'<input[^>]*>',
-                        r'javascript:',
-                        r'on\w+\s*='  # event handlers like onclick, onmouseover
-                    ]
-                    
-                    for pattern in dangerous_patterns:
-                        has_dangerous = bool(re.search(pattern, body, re.IGNORECASE))
+                    found = {match.lastgroup for match in DANGEROUS_PATTERN.finditer(body)}
+                    for index, pattern in enumerate(DANGEROUS_PATTERN_SOURCES):
+                        has_dangerous = f'p{index}' in found
                         self.test_assert(
                             not has_dangerous,
                             f"HTML sanitization - post {i+1} does not contain dangerous pattern '{pattern[:20]}'",
@@ -550,7 +815,7 @@ class APITester:
     
     def test_author_field_formatting(self):
         """Test 12: Author field returns formatted name string"""
-        self.log("\n=== Testing Author Field Formatting ===")
+        self.logger.info("\n=== Testing Author Field Formatting ===")
         
         published_posts = self.get_published_posts()
         if not published_posts:
@@ -558,12 +823,12 @@ class APITester:
         
         # Test author field formatting
         test_count = min(3, len(published_posts))
+        self.fetch_details_batch(published_posts[:test_count])
         
         for i in range(test_count):
             post = published_posts[i]
-            url = post.get('url', '')
-            if '/posts/' in url:
-                slug = url.split('/posts/')[-1].rstrip('/')
+            slug = slug_from_url(post.get('url', ''))
+            if slug is not None:
                 
                 data, success, status_code = self.make_detail_request(slug)
                 
@@ -591,15 +856,13 @@ class APITester:
                         f"Author field is empty or whitespace"
                     )
                     
-                    self.log(f"Author field format: '{author}'")
+                    self.logger.info("Author field format: '%s'", author)
         
         return True
     
     def test_detail_endpoint_performance(self):
         """Test 13: Performance testing for detail endpoint"""
-        self.log("\n=== Testing Detail Endpoint Performance ===")
-        
-        import time
+        self.logger.info("\n=== Testing Detail Endpoint Performance ===")
         
         published_posts = self.get_published_posts()
         if not published_posts:
@@ -607,29 +870,40 @@ class APITester:
         
         # Test performance with first available post
         post = published_posts[0]
-        url = post.get('url', '')
-        if '/posts/' in url:
-            slug = url.split('/posts/')[-1].rstrip('/')
+        slug = slug_from_url(post.get('url', ''))
+        if slug is not None:
             
-            start_time = time.time()
-            data, success, status_code = self.make_detail_request(slug)
-            end_time = time.time()
+            # Time both requests on a brand-new pool: the first pays for connection
+            # setup, the second should ride the kept-alive connection
+            detail_url = f"{self.base_url}/api/v1/posts/{slug}/"
+            with mount_pooled_adapter(requests.Session()) as session:
+                start_time = perf_counter()
+                session.get(detail_url, timeout=REQUEST_TIMEOUT)
+                t_cold = perf_counter() - start_time
+                
+                start_time = perf_counter()
+                session.get(detail_url, timeout=REQUEST_TIMEOUT)
+                t_warm = perf_counter() - start_time
             
-            response_time = end_time - start_time
+            self.test_assert(
+                t_cold < 5.0,
+                "Detail endpoint performance - response time under 5 seconds",
+                f"Response took {t_cold:.2f} seconds"
+            )
             
             self.test_assert(
-                response_time < 5.0,
-                f"Detail endpoint performance - response time under 5 seconds",
-                f"Response took {response_time:.2f} seconds"
+                t_warm < 0.5,
+                "Detail endpoint performance - warm response time under 500ms",
+                f"Warm response took {t_warm * 1000:.0f}ms"
             )
             
-            self.log(f"Detail endpoint response time: {response_time:.3f} seconds")
+            self.logger.info("Detail endpoint response time: cold %.3fs, warm %.3fs", t_cold, t_warm)
         
         return True
     
     def test_detail_edge_cases(self):
         """Test 14: Edge cases for detail endpoint"""
-        self.log("\n=== Testing Detail Endpoint Edge Cases ===")
+        self.logger.info("\n=== Testing Detail Endpoint Edge Cases ===")
         
         # Test various edge case slugs
         edge_case_slugs = [
@@ -669,6 +943,7 @@ class APITester:
             self.test_combined_queries,
             self.test_edge_cases,
             self.test_response_performance,
+            self.test_load_throughput,
             
             # Detail endpoint tests
             self.test_detail_endpoint_success,
@@ -680,6 +955,8 @@ class APITester:
             self.test_detail_edge_cases,
         ]
         
+        # Fetch the shared post sample once so parallel detail tests don't race to load it
+        self.get_published_posts()
         return self._run_tests(test_methods)
     
     def run_list_tests(self):
@@ -696,6 +973,7 @@ class APITester:
             self.test_combined_queries,
             self.test_edge_cases,
             self.test_response_performance,
+            self.test_load_throughput,
         ]
         
         return self._run_tests(test_methods)
@@ -716,16 +994,27 @@ class APITester:
             self.test_detail_edge_cases,
         ]
         
+        # Fetch the shared post sample once so parallel detail tests don't race to load it
+        self.get_published_posts()
         return self._run_tests(test_methods)
     
+    def _safe_call(self, test_method):
+        """Run one test method, counting an unexpected exception as a failure"""
+        try:
+            test_method()
+        except Exception as e:
+            self.logger.error("Test method %s failed with exception: %s", test_method.__name__, e)
+            with self._counter_lock:
+                self.failed += 1
+    
     def _run_tests(self, test_methods):
         """Helper method to run a list of test methods"""
-        for test_method in test_methods:
-            try:
-                test_method()
-            except Exception as e:
-                self.log(f"Test method {test_method.__name__} failed with exception: {e}", "ERROR")
-                self.failed += 1
+        parallel = [m for m in test_methods if m.__name__ not in ISOLATED_TESTS]
+        isolated = [m for m in test_methods if m.__name__ in ISOLATED_TESTS]
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TESTS) as pool:
+            list(pool.map(self._safe_call, parallel))
+        for test_method in isolated:
+            self._safe_call(test_method)
         
         # Print summary
         print("\n" + "=" * 60)
@@ -735,6 +1024,8 @@ class APITester:
         print(f"❌ Failed: {self.failed}")
         if self.passed + self.failed > 0:
             print(f"📈 Success Rate: {(self.passed/(self.passed + self.failed)*100):.1f}%")
+        if self.cached_responses:
+            print(f"♻️  {self.cached_responses} responses came from the on-disk cache; use --no-cache after server changes")
         
         if self.failed > 0:
             print("\n⚠️  Some tests failed. Check the output above for details.")
@@ -771,30 +1062,59 @@ def main():
         action='store_true',
         help='Run only list endpoint tests'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Send every request to the server instead of reusing responses from the on-disk cache'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=300,
+        help='Seconds cached responses stay valid on disk (default: 300)'
+    )
+    parser.add_argument(
+        '--load-requests',
+        type=int,
+        default=0,
+        help='Fire this many list requests to report throughput and p50/p95/p99 latency (default: 0, skipped)'
+    )
+    parser.add_argument(
+        '--load-concurrency',
+        type=int,
+        default=32,
+        help='Concurrent workers for --load-requests (default: 32)'
+    )
     
     args = parser.parse_args()
     
-    tester = APITester(base_url=args.base_url, verbose=args.verbose)
+    logging.basicConfig(format='[%(levelname)s] %(message)s', stream=sys.stdout)
     
-    if args.endpoint_check:
-        print(f"🔍 Checking API endpoint: {tester.api_endpoint}")
-        data, success, _ = tester.make_request()
-        if success:
-            print("✅ API endpoint is accessible")
-            print(f"📊 Found {data.get('count', 0)} published posts")
+    with APITester(
+        base_url=args.base_url,
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl,
+        load_requests=args.load_requests,
+        load_concurrency=args.load_concurrency,
+    ) as tester:
+        if args.endpoint_check:
+            print(f"🔍 Checking API endpoint: {tester.api_endpoint}")
+            if tester.endpoint_check():
+                print("✅ API endpoint is accessible")
+            else:
+                print("❌ API endpoint is not accessible")
+                print("\n💡 Make sure your Django server is running:")
+                print("   python manage.py runserver")
+            return
+        
+        # Determine which tests to run
+        if args.detail_only:
+            success = tester.run_detail_tests()
+        elif args.list_only:
+            success = tester.run_list_tests()
         else:
-            print("❌ API endpoint is not accessible")
-            print("\n💡 Make sure your Django server is running:")
-            print("   python manage.py runserver")
-        return
-    
-    # Determine which tests to run
-    if args.detail_only:
-        success = tester.run_detail_tests()
-    elif args.list_only:
-        success = tester.run_list_tests()
-    else:
-        success = tester.run_all_tests()
+            success = tester.run_all_tests()
     
     sys.exit(0 if success else 1)
 